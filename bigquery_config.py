@@ -3,16 +3,57 @@ Configuration management for Google Cloud BigQuery integration
 """
 
 import os
+import copy
 import json
+import mmap
+import time
+import getpass
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _json_dumps(obj):
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+# Config files at least this large are parsed straight from an mmap
+MMAP_MIN_BYTES = 4096
+
+def _read_json_file(path, size):
+    # mmap setup costs more than a plain read for small files
+    if size < MMAP_MIN_BYTES:
+        return _json_loads(path.read_bytes())
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return _json_loads(view if orjson else bytes(view))
+
+# Seconds a cached `gcloud auth list` result is reused before re-running the CLI
+GCLOUD_AUTH_CACHE_TTL = 60
+
+# Resolved path -> (mtime_ns, size, parsed config); one entry per file, replaced when it changes
+_CFG_CACHE = {}
+
 def load_bigquery_config(config_file='.bigquery_config.json'):
     """Load BigQuery configuration from file"""
     config_path = Path(config_file)
     if config_path.exists():
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            st = config_path.stat()
+            key = str(config_path.resolve())
+            cached = _CFG_CACHE.get(key)
+            if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+                cached = (st.st_mtime_ns, st.st_size, _read_json_file(config_path, st.st_size))
+                _CFG_CACHE[key] = cached
+            return copy.deepcopy(cached[2])
         except Exception as e:
             print(f"Error loading config: {e}")
             return None
@@ -21,52 +62,118 @@ def load_bigquery_config(config_file='.bigquery_config.json'):
 def save_bigquery_config(config, config_file='.bigquery_config.json'):
     """Save BigQuery configuration to file"""
     try:
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        Path(config_file).write_bytes(_json_dumps(config))
+        _CFG_CACHE.clear()
         return True
     except Exception as e:
         print(f"Error saving config: {e}")
         return False
 
-def setup_google_cloud_auth():
-    """Check and guide user through Google Cloud authentication setup"""
-    auth_methods = []
-    
-    # Check for service account key file
-    if os.environ.get('GOOGLE_APPLICATION_CREDENTIALS'):
-        key_file = os.environ['GOOGLE_APPLICATION_CREDENTIALS']
-        if os.path.exists(key_file):
-            auth_methods.append(f"✅ Service account key file: {key_file}")
+def _gcloud_auth_cache_path():
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(cache_home) / 'etl-pipeline' / 'gcloud_auth.json'
+
+def _gcloud_active_config():
+    # gcloud picks its configuration from the env var first, then the config dir's active_config file
+    config_dir = os.environ.get('CLOUDSDK_CONFIG')
+    if not config_dir:
+        if os.name == 'nt':
+            config_dir = os.path.join(os.environ.get('APPDATA', ''), 'gcloud')
         else:
-            auth_methods.append(f"❌ Service account key file not found: {key_file}")
-    
-    # Check for gcloud CLI authentication
+            config_dir = os.path.join(Path.home(), '.config', 'gcloud')
+    active = os.environ.get('CLOUDSDK_ACTIVE_CONFIG_NAME')
+    if not active:
+        try:
+            active = Path(config_dir, 'active_config').read_text().strip()
+        except OSError:
+            active = ''
+    return config_dir, active or 'default'
+
+def _has_active_account(stdout):
     try:
-        import subprocess
-        result = subprocess.run(['gcloud', 'auth', 'list', '--format=json'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            accounts = json.loads(result.stdout)
-            active_accounts = [acc for acc in accounts if acc.get('status') == 'ACTIVE']
-            if active_accounts:
-                auth_methods.append(f"✅ gcloud CLI authenticated as: {active_accounts[0].get('account')}")
-            else:
-                auth_methods.append("❌ gcloud CLI not authenticated")
-        else:
-            auth_methods.append("❌ gcloud CLI not available")
+        return any(acc.get('status') == 'ACTIVE' for acc in _json_loads(stdout))
     except Exception:
-        auth_methods.append("❌ gcloud CLI not available")
-    
-    # Check for Application Default Credentials
+        return False
+
+def _gcloud_auth_list():
+    """Run `gcloud auth list`, reusing a successful result younger than GCLOUD_AUTH_CACHE_TTL seconds"""
+    cache_path = _gcloud_auth_cache_path()
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = ''
+    config_dir, active_config = _gcloud_active_config()
+    cache_key = f"{user}:{config_dir}:{active_config}:{os.environ.get('CLOUDSDK_CORE_ACCOUNT', '')}"
+    try:
+        cache = _json_loads(cache_path.read_bytes())
+        if cache.get('key') == cache_key and time.time() - cache['ts'] < GCLOUD_AUTH_CACHE_TTL:
+            return cache['rc'], cache['stdout']
+    except Exception:
+        pass
+
+    result = subprocess.run(['gcloud', 'auth', 'list', '--format=json'],
+                          capture_output=True, text=True, timeout=10)
+    # Failures are not cached, so a check right after `gcloud auth login` sees the new account
+    if result.returncode == 0 and _has_active_account(result.stdout):
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # The cache holds account emails: write it owner-only and swap it in atomically
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_json_dumps({
+                    'key': cache_key,
+                    'ts': time.time(),
+                    'rc': result.returncode,
+                    'stdout': result.stdout
+                }))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    return result.returncode, result.stdout
+
+def _check_env_creds():
+    """Check for a service account key file"""
+    key_file = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
+    if not key_file:
+        return None
+    if os.path.exists(key_file):
+        return f"✅ Service account key file: {key_file}"
+    return f"❌ Service account key file not found: {key_file}"
+
+def _check_gcloud():
+    """Check for gcloud CLI authentication"""
+    try:
+        returncode, stdout = _gcloud_auth_list()
+        if returncode != 0:
+            return "❌ gcloud CLI not available"
+        accounts = _json_loads(stdout)
+        active_accounts = [acc for acc in accounts if acc.get('status') == 'ACTIVE']
+        if active_accounts:
+            return f"✅ gcloud CLI authenticated as: {active_accounts[0].get('account')}"
+        return "❌ gcloud CLI not authenticated"
+    except Exception:
+        return "❌ gcloud CLI not available"
+
+def _check_adc():
+    """Check for Application Default Credentials"""
     try:
         from google.auth import default
         credentials, project = default()
         if credentials:
-            auth_methods.append(f"✅ Application Default Credentials available (project: {project})")
+            return f"✅ Application Default Credentials available (project: {project})"
+        return None
     except Exception:
-        auth_methods.append("❌ Application Default Credentials not available")
-    
-    return auth_methods
+        return "❌ Application Default Credentials not available"
+
+def setup_google_cloud_auth():
+    """Check and guide user through Google Cloud authentication setup"""
+    # The probes are independent and latency-bound (filesystem, subprocess, metadata server)
+    checks = (_check_env_creds, _check_gcloud, _check_adc)
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(check) for check in checks]
+        results = [future.result() for future in futures]
+    return [message for message in results if message]
 
 def get_setup_instructions():
     """Get setup instructions for Google Cloud integration"""
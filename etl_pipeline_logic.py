@@ -4,25 +4,90 @@
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
 import logging
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
 import re
-import warnings
 import io
+import codecs
 import os
+import mmap
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('etl_cleaning_log.txt', mode='w'),
-        logging.StreamHandler()
-    ],
-    force=True
-)
+# Configure logging once; re-importing the module (e.g. a notebook reload) must not truncate the log.
+# Records are only enqueued on the calling thread; a background listener does the file/console I/O.
+# The file is opened lazily so spawned workers, which forward records to the parent instead
+# (see _init_worker), never truncate it.
+LOG_FILE = 'etl_cleaning_log.txt'
+_LOG_HANDLER_NAME = 'etl_pipeline_queue'
+if not any(h.get_name() == _LOG_HANDLER_NAME for h in logging.getLogger().handlers):
+    _log_queue = queue.Queue(-1)
+    _queue_handler = QueueHandler(_log_queue)
+    _queue_handler.set_name(_LOG_HANDLER_NAME)
+    _queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    _log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    _log_outputs = [logging.FileHandler(LOG_FILE, mode='w', delay=True), logging.StreamHandler()]
+    for _handler in _log_outputs:
+        _handler.setFormatter(_log_formatter)
+    logging.basicConfig(level=logging.INFO, handlers=[_queue_handler], force=True)
+    _log_listener = QueueListener(_log_queue, *_log_outputs)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
-warnings.filterwarnings('ignore', category=UserWarning, module='pandas')
+
+# Copy-on-Write is always on from pandas 3; opt in on 2.x so column writes never copy defensively
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Cell values read as missing: pyarrow's defaults plus the spellings seen in RoofLink exports
+_NULL_VALUES = list(pacsv.ConvertOptions().null_values) + ['', 'NULL', 'null', 'N/A', 'n/a', 'None', '<NA>']
+
+# Separator line framing the per-file cleaning banner
+_LOG_BANNER = "=" * 60
+
+# Bytes inspected by assess_raw_data for encoding and delimiter detection
+ASSESSMENT_SAMPLE_BYTES = 64 * 1024
+
+# Candidate encodings for files that are not valid UTF-8
+_FALLBACK_ENCODINGS = ('cp1252', 'latin_1', 'iso8859_15')
+
+# Runs of characters not allowed in standardized column names
+_COL_RE = re.compile(r'[^a-z0-9_]+')
+
+# Values sampled per text column before attempting a numeric/datetime conversion
+TYPE_SAMPLE_SIZE = 256
+_NUM_RE = re.compile(r'^-?\d+(?:\.\d+)?$')
+_DATE_RE = re.compile(r'\d{2,4}[-/]\d{1,2}')
+# Layouts seen in exports, tried in order against one sample value per date column
+_DATE_FORMATS = (
+    '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d',
+    '%m/%d/%Y %H:%M:%S', '%m/%d/%Y %I:%M:%S %p', '%m/%d/%Y %I:%M %p', '%m/%d/%Y %H:%M',
+    '%m/%d/%Y', '%m/%d/%y', '%Y/%m/%d',
+)
+
+# Text columns with at most this many distinct values (and repeats) are stored as category
+CATEGORY_MAX_UNIQUE = 1024
+
+# Column-name keywords that identify the job URL column
+_URL_KEYS = ('url', 'link', 'href')
+# First run of digits in a job URL; an RE2 pattern with a named group for pyarrow.compute.extract_regex
+_JOB_ID_PATTERN = r'(?P<id>\d+)'
+# Column-name keywords that mark candidate datetime columns
+_DATE_KEYS = ('date', 'time')
+# Row text containing two or more of these marks a summary/header row
+_HEADER_KEYS = ('total', 'summary', 'average', 'count', 'subtotal')
+# Any-keyword RE2 prefilter, so per-keyword counting only runs on candidate rows
+_HEADER_PATTERN = '|'.join(_HEADER_KEYS)
+
+# BigQuery naming rules
+_PROJECT_ID_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9_-]*[a-zA-Z0-9]$')
+_BQ_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
 
 # ================================================================
 # BIGQUERY INTEGRATION FUNCTIONS
@@ -44,13 +109,13 @@ def validate_bigquery_config(bq_config):
     table_id = bq_config['table']
     
     # Basic validation for BigQuery naming rules
-    if not re.match(r'^[a-zA-Z0-9][a-zA-Z0-9_-]*[a-zA-Z0-9]$', project_id) and len(project_id) > 1:
+    if not _PROJECT_ID_RE.match(project_id) and len(project_id) > 1:
         return False, f"Invalid project ID format: {project_id}"
     
-    if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', dataset_id):
+    if not _BQ_NAME_RE.match(dataset_id):
         return False, f"Invalid dataset ID format: {dataset_id}"
         
-    if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', table_id):
+    if not _BQ_NAME_RE.match(table_id):
         return False, f"Invalid table ID format: {table_id}"
     
     return True, "Configuration is valid"
@@ -88,14 +153,14 @@ def upload_to_bigquery(df, bq_config, retries=3):
             dataset_id = f"{bq_config['project']}.{bq_config['dataset']}"
             try:
                 client.get_dataset(dataset_id)
-                logger.info(f"Dataset {dataset_id} already exists")
+                logger.info("Dataset %s already exists", dataset_id)
             except Exception as dataset_error:
                 try:
-                    logger.info(f"Creating dataset {dataset_id}")
+                    logger.info("Creating dataset %s", dataset_id)
                     dataset = bigquery.Dataset(dataset_id)
                     dataset.location = "US"  # Set default location
                     client.create_dataset(dataset, exists_ok=True)
-                    logger.info(f"Successfully created dataset {dataset_id}")
+                    logger.info("Successfully created dataset %s", dataset_id)
                 except Exception as create_error:
                     error_msg = f"Failed to create dataset {dataset_id}: {create_error}"
                     logger.error(error_msg)
@@ -103,7 +168,7 @@ def upload_to_bigquery(df, bq_config, retries=3):
             
             # Upload to BigQuery
             table_id = f"{dataset_id}.{bq_config['table']}"
-            logger.info(f"Uploading data to table {table_id}")
+            logger.info("Uploading data to table %s", table_id)
             
             job_config = bigquery.LoadJobConfig(
                 write_disposition="WRITE_TRUNCATE",  # Overwrite table
@@ -114,7 +179,7 @@ def upload_to_bigquery(df, bq_config, retries=3):
             job = client.load_table_from_dataframe(df, table_id, job_config=job_config)
             job.result()  # Wait for completion
             
-            logger.info(f"Successfully uploaded {len(df)} rows to {table_id}")
+            logger.info("Successfully uploaded %d rows to %s", len(df), table_id)
             
             return {
                 'success': True,
@@ -124,7 +189,7 @@ def upload_to_bigquery(df, bq_config, retries=3):
             }
             
         except Exception as e:
-            logger.warning(f"BigQuery upload attempt {attempt + 1} failed: {e}")
+            logger.warning("BigQuery upload attempt %d failed: %s", attempt + 1, e)
             if attempt == retries - 1:  # Last attempt
                 return {
                     'success': False,
@@ -148,41 +213,57 @@ def assess_raw_data(file_content, file_name):
     Returns:
         dict: Assessment results with encoding and delimiter recommendations
     """
-    logger.info(f"ASSESSING: {file_name}")
+    logger.info("ASSESSING: %s", file_name)
     assessment = {
         'file_name': file_name,
         'issues_found': [],
         'working_encoding': 'utf-8',
         'likely_delimiter': ','
     }
-    decoded_content = ""
+    # Only the leading sample is inspected, trimmed back to the last full line
+    head = file_content[:ASSESSMENT_SAMPLE_BYTES]
+    if len(file_content) > len(head) and b'\n' in head:
+        head = head[:head.rfind(b'\n') + 1]
+    decoded_head = ""
     try:
-        decoded_content = file_content.decode('utf-8')
+        decoded_head = head.decode('utf-8')
     except UnicodeDecodeError:
-        for encoding in ['latin-1', 'cp1252', 'iso-8859-1']:
-            try:
-                decoded_content = file_content.decode(encoding)
-                assessment['working_encoding'] = encoding
-                logger.info(f"Successfully decoded {file_name} with fallback encoding: {encoding}")
-                break
-            except UnicodeDecodeError:
-                continue
-    if not decoded_content:
-        logger.error(f"Failed to decode file: {file_name}")
+        # latin-1 decodes any byte sequence, so detect the real encoding instead of trying a list
+        encoding = _detect_encoding(head)
+        decoded_head = head.decode(encoding, errors='replace')
+        assessment['working_encoding'] = encoding
+        logger.info("Successfully decoded %s with fallback encoding: %s", file_name, encoding)
+    if not decoded_head:
+        logger.error("Failed to decode file: %s", file_name)
         assessment['issues_found'].append("Failed to decode file.")
         return assessment
-    lines = decoded_content.splitlines()
+    lines = decoded_head.splitlines()
     comma_counts = [line.count(',') for line in lines[:20]]
     if comma_counts and max(comma_counts) > 0:
         assessment['likely_delimiter'] = ','
     try:
-        pd.read_csv(io.StringIO(decoded_content), delimiter=assessment['likely_delimiter'], nrows=10)
+        pd.read_csv(
+            io.BytesIO(head),
+            delimiter=assessment['likely_delimiter'],
+            encoding=assessment['working_encoding'],
+            nrows=10
+        )
     except Exception as e:
-        logger.error(f"Pandas read error during assessment of {file_name}: {e}")
+        logger.error("Pandas read error during assessment of %s: %s", file_name, e)
         assessment['issues_found'].append(f"Pandas read error: {e}")
     return assessment
 
 
+def _detect_encoding(sample):
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        return 'latin-1'
+    # Unconstrained detection misreads short Western-European samples as e.g. cp775
+    match = from_bytes(sample, cp_isolation=list(_FALLBACK_ENCODINGS)).best()
+    return match.encoding if match else 'latin-1'
+
+
 def clean_csv_data(file_content, file_name, assessment_results=None):
     """
     Orchestrates the data cleaning process and generates a data quality report.
@@ -192,75 +273,56 @@ def clean_csv_data(file_content, file_name, assessment_results=None):
             - pd.DataFrame: The cleaned dataframe.
             - pd.DataFrame: The data quality report dataframe.
     """
-    logger.info("=" * 60)
-    logger.info(f"STARTING DATA CLEANING FOR: {file_name}")
-    logger.info("=" * 60)
+    logger.info("%s\nSTARTING DATA CLEANING FOR: %s\n%s", _LOG_BANNER, file_name, _LOG_BANNER)
 
     try:
         delimiter = assessment_results.get('likely_delimiter', ',') if assessment_results else ','
         encoding = assessment_results.get('working_encoding', 'utf-8') if assessment_results else 'utf-8'
-        df_original = pd.read_csv(
-            io.BytesIO(file_content),
-            delimiter=delimiter,
-            encoding=encoding,
-            on_bad_lines='warn',
-            low_memory=False,
-            na_values=['', 'NULL', 'null', 'N/A', 'n/a']
-        )
-        df = df_original.copy()
-        logger.info(f"Loaded {len(df)} raw rows from {file_name}.")
+        table = _read_csv_arrow(file_content, file_name, delimiter, encoding)
+        logger.info("Loaded %d raw rows from %s.", table.num_rows, file_name)
     except Exception as e:
-        logger.error(f"CRITICAL: Failed to load data for {file_name}. Error: {e}")
+        logger.error("CRITICAL: Failed to load data for %s. Error: %s", file_name, e)
         return None, None
 
     # --- Generate Initial Report Stats ---
     report = pd.DataFrame({
-        'original_column': df.columns,
-        'missing_percent_before': (df.isnull().sum() * 100 / len(df)).round(2)
+        'original_column': table.column_names,
+        'missing_percent_before': pd.Series(
+            [col.null_count for col in table.columns], index=table.column_names, dtype='float64'
+        ).mul(100).div(table.num_rows).round(2)
     })
 
     # --- Cleaning Steps ---
-    df, rows_removed = _remove_summary_rows(df)
-    df, column_map = _standardize_column_names(df)
-    df, job_id_cols_dropped = _extract_job_id(df)
-    df, filled_info, dropped_info = _handle_missing_values(df)
-    df, type_changes = _optimize_data_types(df)
+    # Summary rows, column renames, job_id extraction and the URL/unnamed column drop all run
+    # on the Arrow table, so the frame is materialized in pandas once with only kept columns
+    table, rows_removed = _remove_summary_rows(table)
+    table, column_map = _standardize_column_names(table)
+    table, job_ids, job_id_cols_dropped = _extract_job_id(table)
+    df = table.to_pandas(types_mapper=_arrow_to_pandas_dtype, split_blocks=True, self_destruct=True)
+    del table
+    df['job_id'] = job_ids
+    df, filled_info, dropped_info, type_changes = _process_columns(df)
+    df, downcast_cols = _downcast_numeric(df)
     df, duplicates_removed = _remove_duplicates(df)
 
     # --- Compile Final Report ---
     report['cleaned_column'] = report['original_column'].map(column_map)
 
-    actions = []
-    details = []
-    for index, row in report.iterrows():
-        action = "Kept"
-        detail = ""
-        cleaned_col = row['cleaned_column']
-
-        if cleaned_col in filled_info:
-            action = "Filled"
-            detail = f"Filled with {filled_info[cleaned_col]}"
-
-        if cleaned_col in type_changes:
-            detail += f" | Type changed to {type_changes[cleaned_col]}"
-            detail = detail.strip(" | ")
-
-        if cleaned_col not in df.columns:
-            if cleaned_col in dropped_info:
-                action = "Dropped"
-                detail = f"Dropped (>90% missing)"
-            elif cleaned_col in job_id_cols_dropped:
-                action = "Dropped"
-                detail = "Dropped after job_id extraction"
-            else:
-                action = "Dropped"
-                detail = "Column was removed"
-
-        actions.append(action)
-        details.append(detail)
-
-    report['action'] = actions
-    report['details'] = details
+    cleaned = report['cleaned_column']
+    kept = cleaned.isin(df.columns)
+    filled = cleaned.isin(list(filled_info))
+
+    fill_detail = cleaned.map({c: f"Filled with {how}" for c, how in filled_info.items()}).fillna('')
+    type_detail = cleaned.map({c: f"Type changed to {t}" for c, t in type_changes.items()}).fillna('')
+    kept_detail = fill_detail.str.cat(type_detail, sep=' | ').str.strip(" | ")
+    dropped_detail = np.select(
+        [cleaned.isin(dropped_info), cleaned.isin(job_id_cols_dropped)],
+        ["Dropped (>90% missing)", "Dropped after job_id extraction"],
+        default="Column was removed"
+    )
+
+    report['action'] = np.select([~kept, filled], ["Dropped", "Filled"], default="Kept")
+    report['details'] = np.where(kept, kept_detail, dropped_detail)
 
     # Ensure job_id appears in the report
     if 'job_id' not in report['cleaned_column'].values:
@@ -275,105 +337,373 @@ def clean_csv_data(file_content, file_name, assessment_results=None):
             }])
         ], ignore_index=True)
 
-    logger.info(f"CLEANING COMPLETE for {file_name}. Final shape: {df.shape}")
+    logger.info("CLEANING COMPLETE for %s. Final shape: %s", file_name, df.shape)
     return df, report
 
+
+def clean_csv_file(path, assessment_results=None):
+    """
+    Clean a CSV file on disk without first reading it into a Python bytes object.
+
+    The file is memory-mapped and handed to the same parser as clean_csv_data, so
+    only the pages the parser touches are loaded. When no assessment is given, the
+    file is assessed first.
+
+    Returns:
+        tuple: (cleaned DataFrame, data quality report DataFrame), or (None, None)
+        if the file could not be read.
+    """
+    file_name = os.path.basename(path)
+    try:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                logger.error("CRITICAL: Failed to load data for %s. Error: file is empty", file_name)
+                return None, None
+            mapped = _map_file(f)
+    except OSError as e:
+        logger.error("CRITICAL: Failed to load data for %s. Error: %s", file_name, e)
+        return None, None
+
+    with mapped:
+        if assessment_results is None:
+            assessment_results = assess_raw_data(mapped, file_name)
+        return clean_csv_data(mapped, file_name, assessment_results)
+
+def clean_csv_files(paths, max_workers=None):
+    """
+    Clean several CSV files on disk in parallel, one worker process per file.
+
+    Each worker opens and maps its own file, so raw contents are never pickled
+    between processes; only the cleaned results come back. Worker log records
+    are forwarded to this process's logging handlers.
+
+    Workers are started with the 'spawn' method, which re-imports the calling
+    script in each worker. A script that calls this at module level must do so
+    under an ``if __name__ == "__main__":`` guard.
+
+    Returns:
+        list: (cleaned DataFrame, data quality report DataFrame) per path, in input order.
+    """
+    paths = list(paths)
+    if not paths:
+        return []
+    # Importing this module starts the log listener thread, and forking a threaded process can
+    # deadlock; spawned workers re-import it instead and _init_worker redirects their logging
+    mp_context = multiprocessing.get_context('spawn')
+    root = logging.getLogger()
+    log_queue = mp_context.Queue(-1)
+    listener = QueueListener(log_queue, *root.handlers)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers or min(len(paths), os.cpu_count() or 1),
+                                 mp_context=mp_context, initializer=_init_worker,
+                                 initargs=(log_queue, root.level)) as executor:
+            return list(executor.map(clean_csv_file, paths))
+    finally:
+        listener.stop()
+        log_queue.close()
+
+def _init_worker(log_queue, level):
+    # Route records to the parent; the worker's own log file is never opened
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
 # ================================================================
 # DATA CLEANING HELPER FUNCTIONS
 # ================================================================
 
-def _remove_summary_rows(df):
-    def is_likely_header_row(row):
-        row_str = ' '.join([str(val).lower() for val in row if pd.notna(val)])
-        header_keywords = ['total', 'summary', 'average', 'count', 'subtotal']
-        return sum(1 for keyword in header_keywords if keyword in row_str) >= 2
-    header_mask = df.apply(is_likely_header_row, axis=1)
-    num_removed = header_mask.sum()
+def _map_file(f):
+    # Prefault the pages on Linux so the parser does not stall on page faults
+    if hasattr(mmap, 'MAP_POPULATE'):
+        return mmap.mmap(f.fileno(), 0, flags=mmap.MAP_PRIVATE | mmap.MAP_POPULATE, prot=mmap.PROT_READ)
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _read_csv_arrow(file_content, file_name, delimiter, encoding):
+    table, short_rows = _parse_csv_arrow(file_content, file_name, delimiter, encoding)
+    # The assessment only samples the head; a non-UTF-8 byte further down makes pyarrow
+    # return that column as binary, so detect the real encoding around it and re-read
+    if any(pa.types.is_binary(field.type) for field in table.schema):
+        window = _invalid_utf8_window(file_content)
+        if window is not None:
+            encoding = _detect_encoding(window)
+            logger.warning("Non-UTF-8 bytes found past the assessment sample of %s; re-reading as %s.",
+                           file_name, encoding)
+            table, short_rows = _parse_csv_arrow(file_content, file_name, delimiter, encoding)
+    if short_rows:
+        table = _read_csv_padded(file_content, delimiter, encoding, table.schema)
+    # Match pandas header handling: blank headers become 'Unnamed: N', repeats get a '.N' suffix
+    names, seen = [], {}
+    for i, name in enumerate(table.column_names):
+        name = name if name.strip() else f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return table.rename_columns(names)
+
+def _parse_csv_arrow(file_content, file_name, delimiter, encoding):
+    short_rows = 0
+    def handle_bad_line(row):
+        nonlocal short_rows
+        # Only field counts are logged; the row text holds customer data. The multi-threaded
+        # parser does not track row numbers, so row.number is usually None.
+        where = f" {row.number}" if row.number is not None else ""
+        if row.actual_columns < row.expected_columns:
+            short_rows += 1
+            logger.warning("Padding short row%s in %s with nulls: expected %d fields, saw %d.",
+                           where, file_name, row.expected_columns, row.actual_columns)
+        else:
+            logger.warning("Skipping row%s in %s: expected %d fields, saw %d.",
+                           where, file_name, row.expected_columns, row.actual_columns)
+        return 'skip'
+    table = pacsv.read_csv(
+        pa.BufferReader(pa.py_buffer(file_content)),
+        read_options=pacsv.ReadOptions(encoding=encoding),
+        parse_options=pacsv.ParseOptions(delimiter=delimiter, invalid_row_handler=handle_bad_line),
+        convert_options=pacsv.ConvertOptions(null_values=_NULL_VALUES, strings_can_be_null=True)
+    )
+    return table, short_rows
+
+def _invalid_utf8_window(file_content):
+    # Decode in bounded chunks so the whole file is never held as a str
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with memoryview(file_content) as view:
+        for offset in range(0, len(view), ASSESSMENT_SAMPLE_BYTES):
+            try:
+                decoder.decode(view[offset:offset + ASSESSMENT_SAMPLE_BYTES])
+            except UnicodeDecodeError as e:
+                start = max(0, offset + e.start - ASSESSMENT_SAMPLE_BYTES // 2)
+                return bytes(view[start:start + ASSESSMENT_SAMPLE_BYTES])
+    return None
+
+def _read_csv_padded(file_content, delimiter, encoding, schema):
+    # pyarrow cannot pad rows with missing trailing fields; pandas does, as the original loader did.
+    # Every cell is read as text, then cast to the type pyarrow inferred from the complete rows.
+    df = pd.read_csv(io.BytesIO(file_content), delimiter=delimiter, encoding=encoding, dtype=str,
+                     keep_default_na=False, na_values=_NULL_VALUES, on_bad_lines='skip')
+    arrays = []
+    for field, (_, values) in zip(schema, df.items()):
+        text = pa.array(values, type=pa.string(), from_pandas=True)
+        try:
+            arrays.append(text.cast(field.type))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            # A padded row holds a value the inferred type cannot parse; keep the column as text
+            arrays.append(text)
+    return pa.table(arrays, names=schema.names)
+
+def _arrow_to_pandas_dtype(arrow_type):
+    # Strings map to pandas' own StringDtype so to_numeric coercion yields <NA>, not NaN
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype("pyarrow")
+    return pd.ArrowDtype(arrow_type)
+
+def _remove_summary_rows(table):
+    # Numeric, date and boolean cells cannot contain the keywords, so only text columns are scanned
+    text_columns = [
+        col for col in table.columns
+        if pa.types.is_string(col.type) or pa.types.is_large_string(col.type)
+    ]
+    if table.num_rows == 0 or not text_columns:
+        return table, 0
+    # Join each row into one lowercased string and find rows mentioning any keyword in one scan;
+    # distinct keywords are then counted only for those rows.
+    cells = [pc.fill_null(pc.cast(col, pa.large_string()), '') for col in text_columns]
+    row_text = pc.utf8_lower(pc.binary_join_element_wise(*cells, pa.scalar(' ', pa.large_string())))
+    candidates = np.flatnonzero(
+        pc.match_substring_regex(row_text, _HEADER_PATTERN).to_numpy(zero_copy_only=False)
+    )
+    if candidates.size == 0:
+        return table, 0
+    candidate_text = row_text.take(candidates)
+    keyword_hits = sum(
+        pc.match_substring(candidate_text, keyword).to_numpy(zero_copy_only=False).astype(np.int8)
+        for keyword in _HEADER_KEYS
+    )
+    header_mask = np.zeros(table.num_rows, dtype=bool)
+    header_mask[candidates[keyword_hits >= 2]] = True
+    num_removed = int(header_mask.sum())
     if num_removed > 0:
-        logger.info(f"Removing {num_removed} likely summary/header rows.")
-        df = df[~header_mask].copy()
-    return df, num_removed
-
-def _standardize_column_names(df):
-    original_cols = df.columns.tolist()
-    def clean_name(col):
-        name = str(col).strip().lower()
-        name = re.sub(r'[^a-z0-9_]+', '_', name)
-        return name.strip('_')
-    cleaned_cols = [clean_name(col) for col in original_cols]
+        logger.info("Removing %d likely summary/header rows.", num_removed)
+        table = table.filter(pa.array(~header_mask))
+    return table, num_removed
+
+def _clean_column_name(col):
+    return _COL_RE.sub('_', str(col).strip().lower()).strip('_')
+
+def _standardize_column_names(table):
+    original_cols = table.column_names
+    cleaned_cols = [_clean_column_name(col) for col in original_cols]
     column_map = dict(zip(original_cols, cleaned_cols))
-    df.columns = cleaned_cols
+    table = table.rename_columns(cleaned_cols)
     logger.info("Standardized column names.")
-    return df, column_map
+    return table, column_map
 
-def _extract_job_id(df):
-    def find_url_column(d):
-        for col in d.columns:
-            if any(keyword in col.lower() for keyword in ['url', 'link', 'href']):
+def _extract_job_id(table):
+    def find_url_column(names):
+        for col in names:
+            if any(keyword in col.lower() for keyword in _URL_KEYS):
                 return col
         return None
-    url_col = find_url_column(df)
+    url_col = find_url_column(table.column_names)
     cols_to_drop = []
     if url_col:
-        logger.info(f"Found URL column: '{url_col}'. Extracting job_id.")
-        df['job_id'] = df[url_col].astype(str).str.extract(r'(\d+)', expand=False)
-        df['job_id'] = pd.to_numeric(df['job_id'], errors='coerce')
-        cols_to_drop = [url_col] + [c for c in df.columns if 'unnamed' in c]
-        df.drop(columns=cols_to_drop, inplace=True, errors='ignore')
-        valid_ids = df['job_id'].notna().sum()
-        logger.info(f"Successfully extracted {valid_ids} job IDs.")
+        logger.info("Found URL column: '%s'. Extracting job_id.", url_col)
+        urls = pc.cast(table.column(table.column_names.index(url_col)), pa.string())
+        id_text = pc.struct_field(pc.extract_regex(urls, pattern=_JOB_ID_PATTERN), 'id')
+        try:
+            job_ids = pc.cast(id_text, pa.int64()).to_pandas()
+        except pa.ArrowInvalid:
+            # Digit runs too long for int64; coerce them like any other bad value
+            job_ids = pd.to_numeric(id_text.to_pandas(), errors='coerce')
+        cols_to_drop = [url_col] + [c for c in table.column_names if 'unnamed' in c]
+        # Select by position; names may repeat
+        table = table.select([i for i, c in enumerate(table.column_names) if c not in cols_to_drop])
+        valid_ids = job_ids.notna().sum()
+        logger.info("Successfully extracted %d job IDs.", valid_ids)
     else:
         logger.warning("No URL column found. Cannot extract job_id.")
-        df['job_id'] = np.nan
-    return df, cols_to_drop
+        job_ids = np.nan
+    return table, job_ids, cols_to_drop
+
+def _is_text_dtype(dtype):
+    return dtype == 'object' or pd.api.types.is_string_dtype(dtype)
+
+def _sample_matches(s, pattern, threshold=0.9):
+    # Cheap check on a few values before paying for a full-column conversion
+    sample = s.dropna().head(TYPE_SAMPLE_SIZE).astype(str).tolist()
+    if not sample:
+        return False
+    hits = sum(1 for value in sample if pattern.search(value.strip()))
+    return hits / len(sample) > threshold
+
+def _guess_format(sample):
+    # An explicit format keeps pd.to_datetime on its C parser for the whole column
+    if sample is None:
+        return None
+    value = str(sample).strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            datetime.strptime(value, fmt)
+            return fmt
+        except ValueError:
+            continue
+    return None
 
-def _handle_missing_values(df):
+def _process_columns(df):
+    """Drop sparse columns, optimize data types and fill missing values."""
     filled_info = {}
-    dropped_info = []
-    for col in df.columns:
-        if col == 'job_id': continue
-        missing_pct = df[col].isnull().mean() * 100
-        if missing_pct > 90:
-            df.drop(columns=[col], inplace=True)
-            dropped_info.append(col)
-            logger.warning(f"Dropped column '{col}' due to >90% missing values.")
-        elif missing_pct > 0:
-            num_missing = df[col].isnull().sum()
-            fill_value = None
-            if pd.api.types.is_numeric_dtype(df[col]):
-                fill_value = df[col].median()
-                filled_info[col] = f"median ({fill_value})"
-            else:
-                fill_value = df[col].mode().iloc[0] if not df[col].mode().empty else 'Unknown'
-                filled_info[col] = f"mode ('{fill_value}')"
-            df[col].fillna(fill_value, inplace=True)
-            logger.info(f"Column '{col}': Filled {num_missing} missing values with {filled_info[col]}.")
-    return df, filled_info, dropped_info
-
-def _optimize_data_types(df):
     type_changes = {}
-    for col in df.columns:
-        original_type = df[col].dtype
-        if original_type == 'object':
-            df_converted = pd.to_numeric(df[col], errors='coerce')
-            if not df_converted.isnull().all():
-                df[col] = df_converted
+
+    # One reduction over the frame instead of a missing-value scan per column
+    missing_pct = df.isnull().mean() * 100
+    dropped_info = [col for col in missing_pct.index[missing_pct > 90] if col != 'job_id']
+    for col in dropped_info:
+        logger.warning("Dropped column '%s' due to >90%% missing values.", col)
+    if dropped_info:
+        df.drop(columns=dropped_info, inplace=True)
+
+    # Only text columns are candidates for conversion; partition once from the dtypes
+    text_cols = [col for col, dtype in df.dtypes.items() if col != 'job_id' and _is_text_dtype(dtype)]
+    for col in text_cols:
+        s = df[col]
+        original_type = s.dtype
+        converted_types = False
+        if _sample_matches(s, _NUM_RE):
+            converted = pd.to_numeric(s, errors='coerce')
+            if not converted.isnull().all():
+                s = converted
+                converted_types = True
                 type_changes[col] = 'numeric'
-                logger.info(f"Column '{col}': Converted to numeric type.")
-                continue
-        if df[col].dtype == 'object' and any(keyword in col.lower() for keyword in ['date', 'time']):
+                logger.info("Column '%s': Converted to numeric type.", col)
+        if (_is_text_dtype(s.dtype) and any(keyword in col.lower() for keyword in _DATE_KEYS)
+                and _sample_matches(s, _DATE_RE)):
             try:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-                if df[col].dtype != original_type:
+                fmt = _guess_format(s.dropna().iat[0])
+                converted = pd.to_datetime(s, format=fmt, errors='coerce', cache=True)
+                if converted.dtype != original_type:
+                    s = converted
+                    converted_types = True
                     type_changes[col] = 'datetime'
-                    logger.info(f"Column '{col}': Converted to datetime type.")
+                    logger.info("Column '%s': Converted to datetime type.", col)
             except Exception:
-                logger.warning(f"Could not convert column '{col}' to datetime.")
-    return df, type_changes
+                logger.warning("Could not convert column '%s' to datetime.", col)
+        if _is_text_dtype(s.dtype) and s.nunique() <= min(CATEGORY_MAX_UNIQUE, len(s) // 2):
+            s = s.astype('category')
+            converted_types = True
+            type_changes[col] = 'category'
+            logger.info("Column '%s': Converted to category type.", col)
+        if converted_types:
+            df[col] = s
+
+    # Medians for every numeric gap come from a single reduction; modes have no frame-level equivalent
+    missing_counts = df.isnull().sum()
+    fill_cols = [col for col in missing_counts.index[missing_counts > 0] if col != 'job_id']
+    numeric_cols = {col for col, dtype in df.dtypes.items() if pd.api.types.is_numeric_dtype(dtype)}
+    numeric_fill_cols = [col for col in fill_cols if col in numeric_cols]
+    medians = df[numeric_fill_cols].median() if numeric_fill_cols else pd.Series(dtype='float64')
+    fill_map = {}
+    for col in fill_cols:
+        if col in medians.index:
+            fill_value = medians[col]
+            filled_info[col] = f"median ({fill_value})"
+            if pd.api.types.is_integer_dtype(df[col]) and fill_value != int(fill_value):
+                df[col] = df[col].astype('float64')
+        else:
+            modes = df[col].mode()
+            fill_value = modes.iloc[0] if not modes.empty else 'Unknown'
+            filled_info[col] = f"mode ('{fill_value}')"
+        fill_map[col] = fill_value
+        logger.info("Column '%s': Filled %d missing values with %s.", col, missing_counts[col], filled_info[col])
+    if fill_map:
+        df.fillna(fill_map, inplace=True)
+    return df, filled_info, dropped_info, type_changes
+
+def _downcast_numeric(df):
+    # Memory is only measured for the log line, so skip it when INFO is filtered out
+    log_memory = logger.isEnabledFor(logging.INFO)
+    memory_before = df.memory_usage(deep=False).sum() if log_memory else 0
+    downcast_cols = []
+    # job_id is the merge key across files, so its dtype is left alone
+    numeric_cols = [col for col, dtype in df.dtypes.items()
+                    if col != 'job_id' and pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)]
+    for col in numeric_cols:
+        s = df[col]
+        if pd.api.types.is_integer_dtype(s.dtype):
+            downcast = pd.to_numeric(s, downcast='integer')
+            # int8/int16 overflow in ordinary column arithmetic (Arrow raises, NumPy wraps), so
+            # integers are never narrowed below 32 bits
+            if downcast.dtype.itemsize < 4:
+                if s.dtype.itemsize <= 4:
+                    continue
+                downcast = s.astype(_int32_dtype(s.dtype))
+        else:
+            downcast = pd.to_numeric(s, downcast='float')
+            # float32 cannot hold most currency values exactly; only keep lossless downcasts
+            if not downcast.astype(s.dtype).equals(s):
+                continue
+        if downcast.dtype != s.dtype:
+            df[col] = downcast
+            downcast_cols.append(col)
+    if downcast_cols and log_memory:
+        memory_after = df.memory_usage(deep=False).sum()
+        logger.info("Downcast %d numeric columns; memory %d -> %d bytes.", len(downcast_cols), memory_before, memory_after)
+    return df, downcast_cols
+
+def _int32_dtype(dtype):
+    # 32-bit integer dtype of the same family (Arrow, pandas nullable, or NumPy)
+    if isinstance(dtype, pd.ArrowDtype):
+        return pd.ArrowDtype(pa.int32())
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        return pd.Int32Dtype()
+    return np.dtype(np.int32)
 
 def _remove_duplicates(df):
-    num_duplicates = df.duplicated().sum()
+    rows_before = len(df)
+    df = df.drop_duplicates()
+    num_duplicates = rows_before - len(df)
     if num_duplicates > 0:
-        df.drop_duplicates(inplace=True)
-        logger.info(f"Removed {num_duplicates} duplicate rows.")
+        logger.info("Removed %d duplicate rows.", num_duplicates)
     return df, num_duplicates
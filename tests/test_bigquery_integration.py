@@ -1,4 +1,5 @@
 import io
+import json
 import os
 import sys
 import pandas as pd
@@ -205,4 +206,100 @@ def test_setup_instructions():
     assert len(instructions) > 100
     assert "BigQuery" in instructions
     assert "authentication" in instructions.lower()
-    assert "service account" in instructions.lower()
\ No newline at end of file
+    assert "service account" in instructions.lower()
+
+def test_load_bigquery_config_picks_up_changes():
+    """Test that cached config loads are refreshed when the file changes"""
+    config_file = 'test_config_cache.json'
+    try:
+        bigquery_config.save_bigquery_config({'project': 'first'}, config_file)
+        loaded = bigquery_config.load_bigquery_config(config_file)
+        assert loaded == {'project': 'first'}
+
+        # Mutating the returned dict must not leak into the cache
+        loaded['project'] = 'mutated'
+        assert bigquery_config.load_bigquery_config(config_file) == {'project': 'first'}
+
+        bigquery_config.save_bigquery_config({'project': 'second-project'}, config_file)
+        assert bigquery_config.load_bigquery_config(config_file) == {'project': 'second-project'}
+    finally:
+        if os.path.exists(config_file):
+            os.remove(config_file)
+
+
+def test_load_bigquery_config_keeps_one_cache_entry_per_file(tmp_path, monkeypatch):
+    """Test that external edits replace the cached config instead of adding entries"""
+    monkeypatch.setattr(bigquery_config, '_CFG_CACHE', {})
+    config_file = tmp_path / 'config.json'
+    for project in ('a', 'bb', 'ccc'):
+        config_file.write_text(json.dumps({'project': project}))
+        assert bigquery_config.load_bigquery_config(str(config_file)) == {'project': project}
+
+    assert list(bigquery_config._CFG_CACHE) == [str(config_file.resolve())]
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_load_bigquery_config_reads_large_file_through_mmap(tmp_path, monkeypatch, use_orjson):
+    """Test that configs above MMAP_MIN_BYTES load with orjson and with the stdlib json fallback"""
+    if use_orjson and bigquery_config.orjson is None:
+        pytest.skip('orjson not installed')
+    if not use_orjson:
+        monkeypatch.setattr(bigquery_config, 'orjson', None)
+    monkeypatch.setattr(bigquery_config, '_CFG_CACHE', {})
+    config = {
+        'project': 'test-project',
+        'dataset': 'test_dataset',
+        'table': 'test_table',
+        'columns': {f'column_{i}': {'type': 'STRING', 'note': 'é'} for i in range(200)},
+    }
+    config_file = tmp_path / 'config.json'
+    config_file.write_text(json.dumps(config), encoding='utf-8')
+    assert config_file.stat().st_size >= bigquery_config.MMAP_MIN_BYTES
+
+    assert bigquery_config.load_bigquery_config(str(config_file)) == config
+
+
+def test_gcloud_auth_list_is_cached(tmp_path, monkeypatch):
+    """Test that gcloud auth results are reused within the cache TTL"""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    accounts = '[{"account": "dev@example.com", "status": "ACTIVE"}]'
+    completed = Mock(returncode=0, stdout=accounts)
+
+    with patch('bigquery_config.subprocess.run', return_value=completed) as mock_run, \
+            patch('google.auth.default', side_effect=Exception("no ADC")):
+        first = bigquery_config.setup_google_cloud_auth()
+        second = bigquery_config.setup_google_cloud_auth()
+
+    mock_run.assert_called_once()
+    assert any('dev@example.com' in method for method in first)
+    assert first == second
+
+
+def test_gcloud_auth_list_does_not_cache_failures(tmp_path, monkeypatch):
+    """Test that an unauthenticated result is re-checked, e.g. right after `gcloud auth login`"""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    monkeypatch.setenv('CLOUDSDK_CONFIG', str(tmp_path / 'gcloud'))
+    logged_out = Mock(returncode=0, stdout='[]')
+    logged_in = Mock(returncode=0, stdout='[{"account": "dev@example.com", "status": "ACTIVE"}]')
+
+    with patch('bigquery_config.subprocess.run', side_effect=[logged_out, logged_in]) as mock_run:
+        assert bigquery_config._gcloud_auth_list() == (0, '[]')
+        assert 'dev@example.com' in bigquery_config._gcloud_auth_list()[1]
+
+    assert mock_run.call_count == 2
+    cache_file = bigquery_config._gcloud_auth_cache_path()
+    assert cache_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_gcloud_auth_cache_is_keyed_on_active_configuration(tmp_path, monkeypatch):
+    """Test that switching gcloud configurations bypasses the cached account"""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    monkeypatch.setenv('CLOUDSDK_CONFIG', str(tmp_path / 'gcloud'))
+    work = Mock(returncode=0, stdout='[{"account": "work@example.com", "status": "ACTIVE"}]')
+    other = Mock(returncode=0, stdout='[{"account": "other@example.com", "status": "ACTIVE"}]')
+
+    with patch('bigquery_config.subprocess.run', side_effect=[work, other]):
+        monkeypatch.setenv('CLOUDSDK_ACTIVE_CONFIG_NAME', 'work')
+        assert 'work@example.com' in bigquery_config._gcloud_auth_list()[1]
+        monkeypatch.setenv('CLOUDSDK_ACTIVE_CONFIG_NAME', 'other')
+        assert 'other@example.com' in bigquery_config._gcloud_auth_list()[1]
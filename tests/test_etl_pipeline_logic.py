@@ -2,6 +2,7 @@ import io
 import os
 import sys
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 # Ensure the etl_pipeline_logic module is importable
@@ -44,3 +45,149 @@ def test_clean_csv_data_basic():
 
     # Check that job_id column is reported
     assert any(report["cleaned_column"] == "job_id")
+
+
+def test_remove_summary_rows_drops_total_rows():
+    df = pd.DataFrame({
+        "name": ["Alice", "Grand Total", "Bob", None],
+        "amount": [10, 30, 20, None],
+        "note": ["", "summary of all", "total owed", None],
+    })
+    cleaned, removed = etl_pipeline_logic._remove_summary_rows(pa.Table.from_pandas(df))
+
+    # Only the row mentioning two keywords is treated as a summary row
+    assert removed == 1
+    assert cleaned.column("name").to_pylist() == ["Alice", "Bob", None]
+
+
+def test_clean_csv_data_extracts_job_id_and_drops_unnamed():
+    # Trailing delimiter produces a blank header, as in raw RoofLink exports
+    content = b"Job URL,Amount,\nhttps://app.example.com/jobs/101,5,\nhttps://app.example.com/jobs/102,7,\n"
+    df, report = etl_pipeline_logic.clean_csv_data(content, "test.csv")
+
+    assert list(df.columns) == ["amount", "job_id"]
+    assert df["job_id"].tolist() == [101, 102]
+
+
+def test_clean_csv_data_pads_short_rows_in_sample_data():
+    sample_path = os.path.join(os.path.dirname(__file__), "..", "sample_data", "sample_rooflink_data.csv")
+    with open(sample_path, "rb") as f:
+        df, report = etl_pipeline_logic.clean_csv_data(f.read(), "sample_rooflink_data.csv")
+
+    # The last sample row (EST-10020) is short a field; it is padded with nulls, not dropped
+    assert len(df) == 20
+    assert "EST-10020" in df["estimate"].tolist()
+    actions = report.set_index("cleaned_column")["action"]
+    assert actions["last_note_message"] == "Filled"
+    assert actions["insurance_company_name"] == "Filled"
+
+
+def test_clean_csv_data_treats_pandas_null_markers_as_missing():
+    content = b"status,amount\nopen,1\nNone,2\n<NA>,3\nopen,4\n"
+    df, report = etl_pipeline_logic.clean_csv_data(content, "test.csv")
+
+    # Both markers are pandas defaults, so they count as missing rather than as text
+    assert report.set_index("original_column").loc["status", "missing_percent_before"] == 50.0
+
+
+def test_clean_csv_data_redetects_encoding_past_assessment_sample():
+    rows = "".join(f"plain,{i}\n" for i in range(10000)) + "José,10000\n"
+    content = ("name,amount\n" + rows).encode("latin-1")
+
+    # The assessed head is pure ASCII, so the loader must notice the later latin-1 byte itself
+    assessment = etl_pipeline_logic.assess_raw_data(content, "legacy.csv")
+    assert assessment["working_encoding"] == "utf-8"
+    df, _ = etl_pipeline_logic.clean_csv_data(content, "legacy.csv", assessment)
+
+    assert df["name"].iloc[-1] == "José"
+    assert df["name"].iloc[0] == "plain"
+
+
+def test_clean_csv_data_fills_missing_values():
+    content = b"amount,status\n1,open\n,closed\n2,open\n"
+    df, report = etl_pipeline_logic.clean_csv_data(content, "test.csv")
+
+    # Numeric gaps take the median, text gaps take the mode
+    assert df["amount"].tolist() == [1.0, 1.5, 2.0]
+    assert df["status"].tolist() == ["open", "closed", "open"]
+    filled = report.set_index("cleaned_column").loc["amount"]
+    assert filled["action"] == "Filled"
+
+
+def test_clean_csv_file_matches_clean_csv_data(tmp_path):
+    content = b"Job URL,Amount\nhttps://app.example.com/jobs/7,3\nhttps://app.example.com/jobs/8,4\n"
+    csv_path = tmp_path / "export.csv"
+    csv_path.write_bytes(content)
+
+    df_file, report_file = etl_pipeline_logic.clean_csv_file(str(csv_path))
+    df_bytes, _ = etl_pipeline_logic.clean_csv_data(content, "export.csv")
+
+    pd.testing.assert_frame_equal(df_file, df_bytes)
+    assert any(report_file["cleaned_column"] == "job_id")
+
+
+def test_clean_csv_data_categorizes_repeated_text():
+    content = b"status,amount\nopen,1\nopen,2\nclosed,3\n,4\nopen,5\n"
+    df, report = etl_pipeline_logic.clean_csv_data(content, "test.csv")
+
+    assert isinstance(df["status"].dtype, pd.CategoricalDtype)
+    assert df["status"].tolist() == ["open", "open", "closed", "open", "open"]
+    details = report.set_index("cleaned_column").loc["status", "details"]
+    assert "Type changed to category" in details
+
+
+def test_assess_raw_data_detects_cp1252():
+    content = "name,note\nJosé,“quoted” – café\nRenée,naïve façade\n".encode("cp1252") * 10
+    result = etl_pipeline_logic.assess_raw_data(content, "legacy.csv")
+
+    assert result["working_encoding"] == "cp1252"
+    assert result["issues_found"] == []
+
+
+def test_clean_csv_data_parses_dates_with_guessed_format():
+    rows = [f"{month:02d}/25/2024,{month}" for month in range(1, 13)] + ["not a date,13"]
+    content = ("created_date,amount\n" + "\n".join(rows) + "\n").encode()
+    df, _ = etl_pipeline_logic.clean_csv_data(content, "test.csv")
+
+    assert etl_pipeline_logic._guess_format("03/04/2024") == "%m/%d/%Y"
+    assert pd.api.types.is_datetime64_any_dtype(df["created_date"])
+    # Month-first layout is applied to every row
+    assert df["created_date"].iloc[0] == pd.Timestamp("2024-01-25")
+    assert df["created_date"].iloc[11] == pd.Timestamp("2024-12-25")
+
+
+def test_clean_csv_files_matches_sequential_cleaning(tmp_path):
+    paths = []
+    for n in range(3):
+        csv_path = tmp_path / f"export_{n}.csv"
+        csv_path.write_bytes(f"Job URL,Amount\nhttps://app.example.com/jobs/{n},{n}\nhttps://app.example.com/jobs/9{n},5\n".encode())
+        paths.append(str(csv_path))
+
+    results = etl_pipeline_logic.clean_csv_files(paths, max_workers=2)
+
+    assert len(results) == len(paths)
+    for path, (df, report) in zip(paths, results):
+        expected_df, expected_report = etl_pipeline_logic.clean_csv_file(path)
+        pd.testing.assert_frame_equal(df, expected_df)
+        pd.testing.assert_frame_equal(report, expected_report)
+
+
+def test_downcast_numeric_keeps_arithmetic_safe_and_values_exact():
+    df = pd.DataFrame({
+        "job_id": pd.array([1, 2, 3], dtype=pd.ArrowDtype(pa.int64())),
+        "count": pd.array([100, 27, None], dtype=pd.ArrowDtype(pa.int64())),
+        "ratio": pd.array([0.5, 0.25, 1.0], dtype=pd.ArrowDtype(pa.float64())),
+        "price": pd.array([19.99, 5.01, 100.1], dtype=pd.ArrowDtype(pa.float64())),
+    })
+
+    df, downcast_cols = etl_pipeline_logic._downcast_numeric(df)
+
+    # Small integers stop at int32, so summing two rows cannot overflow
+    assert df["count"].dtype == pd.ArrowDtype(pa.int32())
+    assert (df["count"] + df["count"]).tolist()[:2] == [200, 54]
+    # float32 holds 0.5/0.25/1.0 exactly but not 19.99, so only ratio is narrowed
+    assert df["ratio"].dtype == pd.ArrowDtype(pa.float32())
+    assert df["price"].dtype == pd.ArrowDtype(pa.float64())
+    # job_id is the merge key and keeps its dtype
+    assert df["job_id"].dtype == pd.ArrowDtype(pa.int64())
+    assert downcast_cols == ["count", "ratio"]
@@ -0,0 +1,58 @@
+import ast
+import json
+import os
+
+import pandas as pd
+
+NOTEBOOK = os.path.join(os.path.dirname(__file__), "..", "master_etl_pipeline.ipynb")
+
+
+def _load_notebook_function(name):
+    # Only the function definition is executed; the notebook cells also build widgets
+    with open(NOTEBOOK, encoding="utf-8") as f:
+        cells = json.load(f)["cells"]
+    for cell in cells:
+        source = "".join(cell["source"])
+        if cell["cell_type"] != "code" or f"def {name}(" not in source:
+            continue
+        tree = ast.parse(source)
+        node = next(n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == name)
+        namespace = {"pd": pd}
+        exec(compile(ast.Module(body=[node], type_ignores=[]), NOTEBOOK, "exec"), namespace)
+        return namespace[name]
+    raise LookupError(name)
+
+
+create_master_dataset = _load_notebook_function("create_master_dataset")
+
+
+def _results(*frames):
+    return {f"file_{i}.csv": {"success": True, "dataframe": df} for i, df in enumerate(frames)}
+
+
+def test_outer_join_keeps_repeated_job_ids_within_a_file():
+    visits = pd.DataFrame({
+        "job_id": [1.0, 1.0, 2.0],
+        "note": ["first visit", "second visit", "only visit"],
+        "amount": [10, 20, 30],
+    })
+    claims = pd.DataFrame({"job_id": [1.0, 3.0], "note": ["claim note", "new job"], "claim": ["A", "B"]})
+
+    master_df, _ = create_master_dataset(_results(visits, claims), "Outer join (keep all records)")
+
+    # Both job 1 rows survive with their own values; the first file's shared columns win
+    job_1 = master_df[master_df["job_id"] == 1.0]
+    assert job_1["note"].tolist() == ["first visit", "second visit"]
+    assert job_1["amount"].tolist() == [10, 20]
+    assert job_1["claim"].tolist() == ["A", "A"]
+    assert sorted(master_df["job_id"].tolist()) == [1.0, 1.0, 2.0, 3.0]
+
+
+def test_inner_join_keeps_only_matching_job_ids():
+    visits = pd.DataFrame({"job_id": [1.0, 1.0, 2.0], "note": ["first", "second", "other"]})
+    claims = pd.DataFrame({"job_id": [1.0, 3.0], "claim": ["A", "B"]})
+
+    master_df, _ = create_master_dataset(_results(visits, claims), "Inner join (matching records only)")
+
+    assert master_df["note"].tolist() == ["first", "second"]
+    assert master_df["claim"].tolist() == ["A", "A"]